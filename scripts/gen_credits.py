@@ -3,11 +3,13 @@ from __future__ import annotations
 import os
 import re
 import sys
-from importlib.metadata import PackageNotFoundError, metadata
+from collections import deque
+from functools import lru_cache
+from importlib.metadata import distributions
 from itertools import chain
 from pathlib import Path
 from textwrap import dedent
-from typing import Mapping, cast
+from typing import Iterable, Mapping, cast
 
 from jinja2 import StrictUndefined
 from jinja2.sandbox import SandboxedEnvironment
@@ -20,25 +22,69 @@ else:
 
 # Load project configuration
 project_dir = Path(os.getenv("MKDOCS_CONFIG_DIR", "."))
-with project_dir.joinpath("pyproject.toml").open("rb") as pyproject_file:
-    pyproject = tomllib.load(pyproject_file)
+pyproject = tomllib.loads(project_dir.joinpath("pyproject.toml").read_text(encoding="utf-8"))
 
 # Project and dependencies data
 project = pyproject["project"]
 pdm = pyproject["tool"]["pdm"]
-with project_dir.joinpath("pdm.lock").open("rb") as lock_file:
-    lock_data = tomllib.load(lock_file)
+lock_data = tomllib.loads(project_dir.joinpath("pdm.lock").read_text(encoding="utf-8"))
 lock_pkgs = {pkg["name"].lower(): pkg for pkg in lock_data["package"]}
+lock_names = frozenset(lock_pkgs)
 project_name = project["name"]
-regex = re.compile(r"(?P<dist>[\w.-]+)(?P<spec>.*)$")
+regex = re.compile(r"([\w.-]+)(.*)")
 
 
-def _get_license(pkg_name: str) -> str:
-    """Fetch the license for a given package name."""
-    try:
-        data = metadata(pkg_name)
-    except PackageNotFoundError:
-        return "?"
+def _parse_requirement(requirement: str) -> tuple[str, str]:
+    """Split a requirement string into its lowercased distribution name and version spec."""
+    match = regex.fullmatch(requirement)
+    return match.group(1).lower(), match.group(2)  # type: ignore[union-attr]
+
+
+# Parse the requirements of every locked package once
+lock_deps = {
+    pkg_name: [_parse_requirement(pkg_dependency) for pkg_dependency in pkg.get("dependencies", [])]
+    for pkg_name, pkg in lock_pkgs.items()
+}
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize a distribution name as per PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+# Format of a dependency row, and the Jinja environment with the credits template compiled once
+dep_row_format = "[`{name}`](https://pypi.org/project/{name}/) | {summary} | {spec} | `{version}` | {license}"
+credits_template_text = dedent(
+    """
+    # Credits
+
+    These projects were used to build *{{ project_name }}*. **Thank you!**
+
+    [`python`](https://www.python.org/) |
+    [`pdm`](https://pdm.fming.dev/) |
+    [`copier-pdm`](https://github.com/pawamoy/copier-pdm)
+
+    ### Runtime dependencies
+
+    Project | Summary | Version (accepted) | Version (last resolved) | License
+    ------- | ------- | ------------------ | ----------------------- | -------
+    {{ prod_dependencies }}
+
+    ### Development dependencies
+
+    Project | Summary | Version (accepted) | Version (last resolved) | License
+    ------- | ------- | ------------------ | ----------------------- | -------
+    {{ dev_dependencies }}
+
+    {% if more_credits %}**[More credits from the author]({{ more_credits }})**{% endif %}
+    """,
+)
+jinja_env = SandboxedEnvironment(undefined=StrictUndefined)
+credits_template = jinja_env.from_string(credits_template_text)
+
+
+def _license_from_metadata(data: Mapping[str, str]) -> str:
+    """Extract the license name from a distribution's metadata."""
     license_name = cast(dict, data).get("License", "").strip()
     multiple_lines = bool(license_name.count("\n"))
     if multiple_lines or not license_name or license_name == "UNKNOWN":
@@ -48,99 +94,83 @@ def _get_license(pkg_name: str) -> str:
     return license_name or "?"
 
 
-def _get_deps(base_deps: Mapping[str, Mapping[str, str]]) -> dict[str, dict[str, str]]:
+@lru_cache(maxsize=None)
+def _installed_licenses() -> dict[str, str]:
+    """Map installed distributions to their license, searching `sys.path` only once."""
+    licenses: dict[str, str] = {}
+    for dist in distributions():
+        data = dist.metadata
+        # `.get()`, since subscripting a missing Name warns on Python 3.12 and raises from 3.14
+        if (dist_name := cast(dict, data).get("Name")) and (name := _normalize_name(dist_name)) not in licenses:
+            licenses[name] = _license_from_metadata(data)  # type: ignore[arg-type]
+    return licenses
+
+
+def _get_license(pkg_name: str) -> str:
+    """Fetch the license for a given package name."""
+    return _installed_licenses().get(_normalize_name(pkg_name), "?")
+
+
+def _get_deps(base_deps: Iterable[str]) -> dict[str, dict[str, str]]:
     """Retrieve the dependencies and their details."""
     deps = {}
     for dep in base_deps:
-        parsed = regex.match(dep).groupdict()  # type: ignore[union-attr]
-        dep_name = parsed["dist"].lower()
-        if dep_name not in lock_pkgs:
+        dep_name, spec = _parse_requirement(dep)
+        if dep_name not in lock_names:
             continue
         deps[dep_name] = {
             "license": _get_license(dep_name),
-            **parsed,
+            "spec": spec,
             **lock_pkgs[dep_name],
         }
 
-    again = True
-    while again:
-        again = False
-        for pkg_name in lock_pkgs:
-            if pkg_name in deps:
-                for pkg_dependency in lock_pkgs[pkg_name].get("dependencies", []):
-                    parsed = regex.match(pkg_dependency).groupdict()  # type: ignore[union-attr]
-                    dep_name = parsed["dist"].lower()
-                    if (
-                        dep_name in lock_pkgs
-                        and dep_name not in deps
-                        and dep_name != project["name"]
-                    ):
-                        deps[dep_name] = {
-                            "license": _get_license(dep_name),
-                            **parsed,
-                            **lock_pkgs[dep_name],
-                        }
-                        again = True
+    # Walk the dependency graph breadth-first, visiting each package once
+    work = deque(deps)
+    while work:
+        pkg_name = work.popleft()
+        for dep_name, spec in lock_deps[pkg_name]:
+            if dep_name in lock_names and dep_name not in deps and dep_name != project_name:
+                deps[dep_name] = {
+                    "license": _get_license(dep_name),
+                    "spec": spec,
+                    **lock_pkgs[dep_name],
+                }
+                work.append(dep_name)
     return deps
 
 
+def _format_deps(deps: Iterable[dict[str, str]]) -> str:
+    """Format dependencies as table rows, sorted by name."""
+    return "".join(
+        dep_row_format.format(
+            name=dep["name"],
+            summary=dep["summary"],
+            spec=f"`{dep['spec']}`" if dep["spec"] else "",
+            version=dep["version"],
+            license=dep["license"],
+        )
+        + "\n"
+        for dep in sorted(deps, key=lambda dep: dep["name"])
+    )
+
+
 def _render_credits() -> str:
     """Render the credits page."""
-    dev_dependencies = _get_deps(chain(*pdm.get("dev-dependencies", {}).values()))  # type: ignore[arg-type]
+    dev_dependencies = _get_deps(chain.from_iterable(pdm.get("dev-dependencies", {}).values()))
     prod_dependencies = _get_deps(
-        chain(  # type: ignore[arg-type]
+        chain(
             project.get("dependencies", []),
-            chain(*project.get("optional-dependencies", {}).values()),
+            chain.from_iterable(project.get("optional-dependencies", {}).values()),
         ),
     )
 
     template_data = {
         "project_name": project_name,
-        "prod_dependencies": sorted(
-            prod_dependencies.values(),
-            key=lambda dep: dep["name"],
-        ),
-        "dev_dependencies": sorted(
-            dev_dependencies.values(),
-            key=lambda dep: dep["name"],
-        ),
+        "prod_dependencies": _format_deps(prod_dependencies.values()),
+        "dev_dependencies": _format_deps(dev_dependencies.values()),
         "more_credits": "",
     }
-    template_text = dedent(
-        """
-        # Credits
-
-        These projects were used to build *{{ project_name }}*. **Thank you!**
-
-        [`python`](https://www.python.org/) |
-        [`pdm`](https://pdm.fming.dev/) |
-        [`copier-pdm`](https://github.com/pawamoy/copier-pdm)
-
-        {% macro dep_line(dep) -%}
-        [`{{ dep.name }}`](https://pypi.org/project/{{ dep.name }}/) | {{ dep.summary }} | {{ ("`" ~ dep.spec ~ "`") if dep.spec else "" }} | `{{ dep.version }}` | {{ dep.license }}
-        {%- endmacro %}
-
-        ### Runtime dependencies
-
-        Project | Summary | Version (accepted) | Version (last resolved) | License
-        ------- | ------- | ------------------ | ----------------------- | -------
-        {% for dep in prod_dependencies -%}
-        {{ dep_line(dep) }}
-        {% endfor %}
-
-        ### Development dependencies
-
-        Project | Summary | Version (accepted) | Version (last resolved) | License
-        ------- | ------- | ------------------ | ----------------------- | -------
-        {% for dep in dev_dependencies -%}
-        {{ dep_line(dep) }}
-        {% endfor %}
-
-        {% if more_credits %}**[More credits from the author]({{ more_credits }})**{% endif %}
-        """,
-    )
-    jinja_env = SandboxedEnvironment(undefined=StrictUndefined)
-    return jinja_env.from_string(template_text).render(**template_data)
+    return credits_template.render(**template_data)
 
 
 if __name__ == "__main__":
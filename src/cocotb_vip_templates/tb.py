@@ -0,0 +1,176 @@
+"""Test bench components for the Wishbone master bridge in `verilog/wishbone.v`.
+
+The driver plays both the chip side of the bridge (`start_i`, `we_i`, `addr_i`, `data_i`)
+and the Wishbone slave answering it (`wb_ack_i`). The monitor samples the Wishbone master outputs,
+and the scoreboard compares those samples with expected values.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import cocotb
+from cocotb.triggers import ClockCycles, Combine, Edge, ReadOnly, RisingEdge, Timer
+
+if TYPE_CHECKING:
+    from cocotb.handle import SimHandleBase
+
+
+class WishboneDriver:
+    """Drive transactions into the bridge and acknowledge them on the Wishbone side."""
+
+    __slots__ = ("_addr_i", "_clk_edge", "_data_i", "_start_i", "_wb_ack_i", "_wb_dat_o", "_we_i", "dut")
+
+    def __init__(self, dut: SimHandleBase) -> None:
+        """Resolve the DUT handles used by every transaction.
+
+        Parameters:
+            dut: The bridge, or a testbench top exposing its ports.
+        """
+        self.dut = dut
+        self._start_i = dut.start_i
+        self._we_i = dut.we_i
+        self._addr_i = dut.addr_i
+        self._data_i = dut.data_i
+        self._wb_ack_i = dut.wb_ack_i
+        self._wb_dat_o = dut.wb_dat_o
+        self._clk_edge = RisingEdge(dut.clk)
+        # Start idle, whatever an earlier test left on these inputs
+        self._start_i.value = 0
+        self._wb_ack_i.value = 0
+
+    def _drive(self, address: int, we: int) -> None:
+        # Issue all request signals back to back, so they land together before the next edge
+        self._start_i.value = 1
+        self._we_i.value = we
+        self._addr_i.value = address
+
+    async def write(self, address: int, data: int) -> None:
+        """Start a write transaction.
+
+        Parameters:
+            address: Address to write to.
+            data: Data to write.
+        """
+        self._data_i.value = data
+        self._drive(address, we=1)
+        await self._clk_edge
+        self._start_i.value = 0
+
+    async def ack(self, delay_cycles: int = 2) -> None:
+        """Acknowledge the pending transaction for one clock cycle.
+
+        The delay is counted in clock edges rather than time: a timer expiring on an edge would raise and drop
+        `wb_ack_i` within that same edge, before the bridge could sample it.
+
+        Parameters:
+            delay_cycles: Clock cycles to wait before asserting `wb_ack_i`.
+        """
+        await ClockCycles(self.dut.clk, delay_cycles)
+        self._wb_ack_i.value = 1
+        await self._clk_edge
+        self._wb_ack_i.value = 0
+        # Return only once the deassert is applied, so it is not dropped if the test ends here
+        await Timer(1, units="step")
+
+    async def read(self, address: int) -> int:
+        """Start a read transaction and return the registered bus data.
+
+        Right after `RisingEdge` the registers still hold last cycle's values; `ReadOnly()` samples them
+        once this edge has settled, instead of waiting a whole extra cycle. The read then steps out of the
+        read-only phase, so the caller can drive signals as soon as it returns.
+
+        Parameters:
+            address: Address to read from.
+
+        Returns:
+            The value of `wb_dat_o`.
+        """
+        self._drive(address, we=0)
+        await self._clk_edge
+        self._start_i.value = 0
+        await ReadOnly()
+        # int() raises on unresolved x/z bits instead of reading them as 0, and handles any bus width
+        data = int(self._wb_dat_o.value)
+        await Timer(1, units="step")
+        return data
+
+
+class MonitorState:
+    """Last sampled value of each monitored signal."""
+
+    __slots__ = ("busy_o", "wb_ack_i", "wb_adr_o", "wb_cyc_o", "wb_dat_o", "wb_stb_o")
+
+    wb_stb_o: Any
+    """Wishbone strobe."""
+    wb_cyc_o: Any
+    """Wishbone cycle."""
+    wb_adr_o: Any
+    """Wishbone address."""
+    wb_dat_o: Any
+    """Wishbone data out."""
+    wb_ack_i: Any
+    """Wishbone acknowledge."""
+    busy_o: Any
+    """Bridge busy flag."""
+
+
+class WishboneMonitor:
+    """Sample the Wishbone master outputs of the bridge."""
+
+    __slots__ = ("_signals", "data", "dut")
+
+    def __init__(self, dut: SimHandleBase) -> None:
+        """Resolve the monitored DUT handles.
+
+        Parameters:
+            dut: The bridge, or a testbench top exposing its ports.
+        """
+        self.dut = dut
+        self.data = MonitorState()
+        names = ("wb_stb_o", "wb_cyc_o", "wb_adr_o", "wb_dat_o", "wb_ack_i", "busy_o")
+        self._signals = tuple((name, getattr(dut, name)) for name in names)
+
+    async def monitor(self) -> None:
+        """Keep `data` up to date, with one task per signal that only wakes when that signal changes."""
+        await Combine(*(cocotb.start_soon(self._track(name, signal)) for name, signal in self._signals))
+
+    async def _track(self, name: str, signal: SimHandleBase) -> None:
+        data = self.data
+        edge = Edge(signal)
+        while True:
+            setattr(data, name, signal.value)
+            await edge
+
+
+class WishboneScoreboard:
+    """Compare monitored signal values with expected ones."""
+
+    __slots__ = ("expected",)
+
+    def __init__(self) -> None:
+        """Start with no expectations."""
+        self.expected: dict[str, int] = {}
+
+    def expect(self, signal: str, value: int) -> None:
+        """Record the value a signal is expected to have.
+
+        Parameters:
+            signal: Name of a [`MonitorState`][cocotb_vip_templates.tb.MonitorState] attribute.
+            value: Expected value.
+        """
+        self.expected[signal] = value
+
+    def check(self, monitor_data: MonitorState) -> None:
+        """Check every expectation against the monitored values.
+
+        Parameters:
+            monitor_data: The monitor's last sample.
+
+        Raises:
+            AssertionError: When a signal does not have its expected value.
+        """
+        for signal, expected_value in self.expected.items():
+            actual_value = getattr(monitor_data, signal, None)
+            if actual_value != expected_value:
+                raise AssertionError(f"{signal} mismatch: Expected {expected_value}, got {actual_value}")
@@ -0,0 +1,63 @@
+`timescale 1ns/100ps
+// Testbench top: generates the 10ns clock in HDL so cocotb only has to react to it
+module tb_top;
+parameter data_wl = 16;
+parameter adr_wl  = 16;
+
+reg     clk = 1'b0;
+always #5 clk = ~clk;
+
+reg     a_reset_l;
+reg     wb_ack_i;
+wire    wb_we_o;
+wire    wb_stb_o;
+wire    wb_cyc_o;
+wire    [adr_wl-1:0] wb_adr_o;
+reg     [data_wl-1:0] wb_dat_i;
+wire    [data_wl-1:0] wb_dat_o;
+
+reg     intr_h;
+wire    intr_ack_h;
+reg     sync_h;
+
+reg     [adr_wl-1:0] addr_i;
+reg     we_i;
+reg     [data_wl-1:0] data_i;
+wire    [data_wl-1:0] data_o;
+reg     start_i;
+wire    busy_o;
+wire    valid_o;
+
+wire    intr;
+reg     intr_ack;
+wire    sync;
+
+wishbone #(
+    .data_wl(data_wl),
+    .adr_wl(adr_wl)
+) u_wishbone (
+    .clk(clk),
+    .a_reset_l(a_reset_l),
+    .wb_ack_i(wb_ack_i),
+    .wb_we_o(wb_we_o),
+    .wb_stb_o(wb_stb_o),
+    .wb_cyc_o(wb_cyc_o),
+    .wb_adr_o(wb_adr_o),
+    .wb_dat_i(wb_dat_i),
+    .wb_dat_o(wb_dat_o),
+    .intr_h(intr_h),
+    .intr_ack_h(intr_ack_h),
+    .sync_h(sync_h),
+    .addr_i(addr_i),
+    .data_i(data_i),
+    .data_o(data_o),
+    .we_i(we_i),
+    .start_i(start_i),
+    .busy_o(busy_o),
+    .valid_o(valid_o),
+    .intr(intr),
+    .intr_ack(intr_ack),
+    .sync(sync)
+);
+
+endmodule